@@ -1,11 +0,0 @@
-#!/usr/bin/env python
-"""Module wrapper for development."""
-
-import sys
-
-sys.path.insert(0, "/home/gray/src/work/pccc")
-
-import pccc  # noqa: E402
-
-if __name__ == "__main__":
-    pccc.main()
@@ -11,11 +11,53 @@
 """pccc configuration functions."""
 
 import argparse
+import copy
+import functools
 import json
+import os
+import re
 import sys
-import textwrap
-
-import toml
+from types import MappingProxyType
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+# Decode JSON with orjson when it is installed; it raises a subclass of
+# ``json.JSONDecodeError`` with the same location attributes.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_FIELD_LIST_SEPARATOR = re.compile(r"\s*,\s*")
+
+# Commit types required by the conventional commit specification.
+_REQUIRED_TYPES = frozenset(("feat", "fix"))
+
+# Every configuration file option, unset; the loaders copy this and
+# fill in the options present in the file.
+_EMPTY_OPTIONS = MappingProxyType(
+    dict.fromkeys(
+        (
+            "commit",
+            "config_file",
+            "header_length",
+            "body_length",
+            "spell_check",
+            "wrap",
+            "force_wrap",
+            "repair",
+            "types",
+            "scopes",
+            "footers",
+            "required_footers",
+            "ignore_generated_commits",
+            "generated_commits",
+        )
+    )
+)
 
 
 class Config:
@@ -59,6 +101,44 @@ class Config:
         List of required footers.
     """
 
+    __slots__ = (
+        "commit",
+        "config_file",
+        "header_length",
+        "body_length",
+        "repair",
+        "wrap",
+        "force_wrap",
+        "spell_check",
+        "ignore_generated_commits",
+        "generated_commits",
+        "types",
+        "scopes",
+        "footers",
+        "required_footers",
+        "format",
+    )
+
+    # Attributes that ``update()`` may set.
+    _UPDATABLE = frozenset(__slots__)
+
+    # Attributes dumped by ``config_as_dict()``, in order.
+    _AS_DICT_KEYS = (
+        "commit",
+        "header_length",
+        "body_length",
+        "repair",
+        "wrap",
+        "force_wrap",
+        "spell_check",
+        "ignore_generated_commits",
+        "generated_commits",
+        "types",
+        "scopes",
+        "footers",
+        "required_footers",
+    )
+
     def __init__(
         self,
         commit="",
@@ -70,11 +150,11 @@ class Config:
         force_wrap=False,
         spell_check=False,
         ignore_generated_commits=False,
-        generated_commits=[],
-        types=["feat", "fix"],
-        scopes=[],
-        footers=[],
-        required_footers=[],
+        generated_commits=None,
+        types=None,
+        scopes=None,
+        footers=None,
+        required_footers=None,
     ):
         """Create a ``Config()`` object.
 
@@ -95,11 +175,13 @@ class Config:
         self.force_wrap = force_wrap
         self.spell_check = spell_check
         self.ignore_generated_commits = ignore_generated_commits
-        self.generated_commits = generated_commits
-        self.types = types
-        self.scopes = scopes
-        self.footers = footers
-        self.required_footers = required_footers
+        # List defaults are created per object, so that modifying one
+        # object's lists does not modify another's.
+        self.generated_commits = [] if generated_commits is None else generated_commits
+        self.types = ["feat", "fix"] if types is None else types
+        self.scopes = [] if scopes is None else scopes
+        self.footers = [] if footers is None else footers
+        self.required_footers = [] if required_footers is None else required_footers
 
         # Other attributes.
         self.format = "TOML"
@@ -127,30 +209,21 @@ class Config:
             # JSON, if requested.
             rs = json.dumps({"pccc": self.config_as_dict()}, indent=2)
         else:
-            # TOML, by default.
+            # TOML, by default.  The ``toml`` package is only needed
+            # for dumping, so it is not imported with the module.
+            import toml
+
             rs = toml.dumps({"pccc": self.config_as_dict()})
 
         return rs
 
     def __repr__(self):
         """Representation of a ``Config()`` object."""
-        return (
-            f'Config(commit="{self.commit}", '
-            f'config_file="{self.config_file}", '
-            f"header_length={self.header_length}, "
-            f"body_length={self.body_length}, "
-            f"repair={self.repair}, "
-            f"wrap={self.wrap}, "
-            f"force_wrap={self.force_wrap}, "
-            f"spell_check={self.spell_check}, "
-            f"ignore_generated_commits={self.ignore_generated_commits}, "
-            f"generated_commits={self.generated_commits}, "
-            f"types={self.types}, "
-            f"scopes={self.scopes}, "
-            f"footers={self.footers}, "
-            f"required_footers={self.required_footers}, "
-            f'format="{self.format}")'
-        )
+        fields = {"commit": self.commit, "config_file": self.config_file}
+        fields.update(self.config_as_dict())
+        fields["format"] = self.format
+
+        return "Config(" + ", ".join(f"{k}={v!r}" for k, v in fields.items()) + ")"
 
     def set_format(self, format):
         """Set the output format.
@@ -177,29 +250,15 @@ class Config:
             A ``dict`` containing key-value pairs of the configuration
             parameters and their values.
         """
-        return {
-            "commit": self.commit,
-            "header_length": self.header_length,
-            "body_length": self.body_length,
-            "repair": self.repair,
-            "wrap": self.wrap,
-            "force_wrap": self.force_wrap,
-            "spell_check": self.spell_check,
-            "ignore_generated_commits": self.ignore_generated_commits,
-            "generated_commits": self.generated_commits,
-            "types": self.types,
-            "scopes": self.scopes,
-            "footers": self.footers,
-            "required_footers": self.required_footers,
-        }
+        return {k: getattr(self, k) for k in self._AS_DICT_KEYS}
 
     def update(self, *args, **kwargs):
         """Update a configuration.
 
         Update the current configuration object from the provided
-        dictionary, ignoring any keys that are not attributes and
-        values that are ``None``.  The provided key/value pairs
-        override the original values in self.
+        dictionary, ignoring any keys that are not configuration
+        attributes and values that are ``None``.  The provided
+        key/value pairs override the original values in self.
 
         Parameters
         ----------
@@ -207,7 +266,7 @@ class Config:
            Key/value pairs of configuration options.
         """
         for k, v in kwargs.items():
-            if hasattr(self, k) and v is not None:
+            if v is not None and k in self._UPDATABLE:
                 setattr(self, k, v)
 
         return
@@ -231,7 +290,7 @@ class Config:
         ValueError
             Indicates a configuration value is incorrect.
         """
-        if not ("fix" in self.types and "feat" in self.types):
+        if not _REQUIRED_TYPES.issubset(self.types):
             raise ValueError("Commit types must include 'fix' and 'feat'.")
 
         return True
@@ -252,11 +311,11 @@ class Config:
         if args.config_file is not None:
             self.config_file = args.config_file
 
-        # Load the configuration file values.
-        self.update(**_load_file(self.config_file))
-
-        # Load the CLI configuration values.
-        self.update(**vars(args))
+        # Merge the configuration file and CLI values, with set CLI
+        # values overriding file values, and update once.
+        options = _load_file(self.config_file)
+        options.update((k, v) for k, v in vars(args).items() if v is not None)
+        self.update(**options)
 
         return
 
@@ -265,9 +324,10 @@ def _determine_file_format(filename):
     """Determine the format of a configuration file.
 
     Determine the format of a configuration file by attempting to
-    parse the file's contents as TOML, JSON, YAML, and finally BespON,
-    in that order.  Returns the format or raises ``ValueError`` on
-    failure to determine the format.
+    parse the file's contents as JSON and TOML (JSON first for files
+    starting with ``{``), then YAML, and finally BespON.  Returns the
+    format or raises ``ValueError`` on failure to determine the
+    format.  The successful parse is cached for the format's loader.
 
     Parameters
     ----------
@@ -289,25 +349,35 @@ def _determine_file_format(filename):
         Raised if the configuration file does not exist or is not
         readable.
     """
-    contents = ""
     try:
-        with open(filename, "r") as file:
-            contents = file.read()
+        stat = os.stat(filename)
+        contents = _slurp(
+            os.path.abspath(filename),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
     except FileNotFoundError as error:
         print(f"{error.strerror}: {error.filename}")
         raise
 
-    try:
-        toml.loads(contents)
-        return "toml"
-    except toml.TomlDecodeError:
-        pass
+    # A TOML document cannot start with ``{`` and a JSON configuration
+    # must, so the first significant byte picks the format to try
+    # first; the other is only parsed if that fails.  Parsing through
+    # ``_parse_file()`` caches the document, so the loader for the
+    # detected format does not parse the file again.
+    formats = ("toml", "json")
+    if contents.lstrip()[:1] == b"{":
+        formats = ("json", "toml")
 
-    try:
-        json.loads(contents)
-        return "json"
-    except json.JSONDecodeError:
-        pass
+    for format in formats:
+        try:
+            _parse_file(filename, format)
+            return format
+        except (json.JSONDecodeError, tomllib.TOMLDecodeError):
+            pass
+        except FileNotFoundError as error:
+            print(f"{error.strerror}: {error.filename}")
+            raise
 
     # Not implemented.
     # try:
@@ -334,8 +404,8 @@ def _load_file(filename=None):
     ``pccc.json``, ``pccc.yaml``, ``pccc.yml``, and finally
     ``pccc.besp``.  If a file is specified, it will be prepended to
     the default list and processed identically.  The first file that
-    exists and loads will be used.  If no usable file is found,
-    default configuration values will be used.
+    exists, loads, and contains a pccc section will be used.  If no
+    usable file is found, default configuration values will be used.
 
     Note that this loader does not associate file formats and
     extensions; if a file format is recognized and is different than
@@ -359,7 +429,7 @@ def _load_file(filename=None):
         Raised if there are problems decoding a JSON configuration
         file, but should only be raised if the file changes between
         format detection and loading.
-    TomlDecodeError
+    TOMLDecodeError
         Raised if there are problems decoding a TOML configuration
         file, but should only be raised if the file changes between
         format detection and loading.
@@ -368,8 +438,7 @@ def _load_file(filename=None):
         readable, but should only be raised if the file changes
         between format detection and loading.
     """
-    options = {}
-    files = (
+    defaults = (
         "pyproject.toml",
         "pccc.toml",
         "package.json",
@@ -378,37 +447,126 @@ def _load_file(filename=None):
         "pccc.yml",
         "pccc.besp",
     )
+    files = defaults
     if filename:
-        files = (filename,) + files
+        files = (filename,) + tuple(f for f in defaults if f != filename)
 
     for file in files:
+        # Most default candidates do not exist; skip them quietly
+        # rather than failing to open each one.  A missing file named
+        # by the user is still reported.  ``Config()`` always names
+        # ``pyproject.toml``, so a default candidate is never treated
+        # as named by the user.
+        if file in defaults and not os.path.isfile(file):
+            continue
+
         try:
             format = _determine_file_format(file)
-        except (
-            FileNotFoundError,
-            ValueError,
-        ) as error:
+        except FileNotFoundError:
+            # Already reported.
+            continue
+        except ValueError as error:
             print(error)
             continue
 
         if format == "toml":
-            return _load_toml_file(file)
+            options = _load_toml_file(file)
         elif format == "json":
-            return _load_json_file(file)
+            options = _load_json_file(file)
         # Not implemented.
         # elif format == "yaml":
-        #     return _load_yaml_file(file)
+        #     options = _load_yaml_file(file)
         # elif format == "bespon":
-        #     return _load_bespon_file(file)
+        #     options = _load_bespon_file(file)
+
+        # Files without a pccc section do not configure pccc; keep
+        # looking, but report a file named by the user.
+        if options is not None:
+            return options
+
+        if file not in defaults:
+            print(f"{file}: no pccc configuration section")
+
+    return {}
+
+
+def _parse_file(filename, format):
+    """Parse a configuration file, reusing unchanged parses.
+
+    Parse a TOML or JSON configuration file, returning the whole
+    document.  Parsed documents are cached by absolute path,
+    modification time, and size, so reloading an unchanged file skips
+    the parse while any edit to the file invalidates the entry.
+
+    The returned document is shared with the cache and must not be
+    modified; callers copy what they keep.
+
+    Parameters
+    ----------
+    filename : string
+        Configuration file to parse.
+    format : string
+        The file format, either ``toml`` or ``json``.
+
+    Returns
+    -------
+    dict
+       The parsed configuration document.
+
+    Raises
+    ------
+    JSONDecodeError
+        Raised if there are problems decoding a JSON configuration
+        file.
+    TOMLDecodeError
+        Raised if there are problems decoding a TOML configuration
+        file.
+    FileNotFoundError
+        Raised if the configuration file does not exist or is not
+        readable.
+    """
+    stat = os.stat(filename)
+
+    return _parse_file_cached(
+        os.path.abspath(filename),
+        format,
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
 
-    return options
+@functools.lru_cache(maxsize=8)
+def _parse_file_cached(filename, format, mtime_ns, size):
+    """Parse a configuration file; cached by ``_parse_file()``."""
+    contents = _slurp(filename, mtime_ns, size)
+
+    if format == "json":
+        return _json_loads(contents)
+
+    return tomllib.loads(contents.decode("utf-8"))
+
+
+@functools.lru_cache(maxsize=8)
+def _slurp(filename, mtime_ns, size):
+    """Read a whole file as bytes.
+
+    Cached like ``_parse_file_cached()``, so that trying several
+    formats on one file reads it only once.  The file is read with a
+    single unbuffered ``os.read()`` of its full size.
+    """
+    fd = os.open(filename, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
 
 
 def _load_json_file(filename="./package.json"):
     """Load a JSON configuration file, using the ``pccc`` entry.
 
     Load a ``package.json`` configuration file, returning the ``pccc``
-    entry.
+    entry.  A file without a ``pccc`` entry is not a pccc
+    configuration and returns ``None``.
 
     Parameters
     ----------
@@ -417,9 +575,10 @@ def _load_json_file(filename="./package.json"):
 
     Returns
     -------
-    dict
+    dict or None
        Configuration option keys and values, with unset values
-       explicitly set to ``None``.
+       explicitly set to ``None``, or ``None`` without a ``pccc``
+       entry.
 
     Raises
     ------
@@ -431,43 +590,26 @@ def _load_json_file(filename="./package.json"):
         readable.
     """
     try:
-        with open(filename, "r") as file:
-            config = json.load(file)
+        config = _parse_file(filename, "json")
     except json.JSONDecodeError as error:
-        lines = error.doc.split("\n")
+        # Slice out only the offending line of the document.
+        start = error.doc.rfind("\n", 0, error.pos) + 1
+        end = error.doc.find("\n", error.pos)
         print(
             f"In configuration file {filename},"
             f" line {error.lineno}, column {error.colno}:"
         )
-        print(lines[error.lineno - 1])
+        print(error.doc[start:] if end == -1 else error.doc[start:end])
         print(error.msg)
         raise
     except FileNotFoundError as error:
         print(f"{error.strerror}: {error.filename}")
         raise
 
-    empty_options = {
-        "commit": None,
-        "config_file": None,
-        "header_length": None,
-        "body_length": None,
-        "spell_check": None,
-        "ignore_generated_commits": None,
-        "wrap": None,
-        "force_wrap": None,
-        "repair": None,
-        "types": None,
-        "scopes": None,
-        "footers": None,
-        "required_footers": None,
-        "ignore_generated_commits": None,
-        "generated_commits": None,
-    }
-
-    for k, v in config["pccc"].items():
-        empty_options[k] = v
-
-    return empty_options
+    if "pccc" not in config:
+        return None
+
+    return {**_EMPTY_OPTIONS, **copy.deepcopy(config["pccc"])}
 
 
 def _load_toml_file(filename="pyproject.toml"):
@@ -475,7 +617,8 @@ def _load_toml_file(filename="pyproject.toml"):
 
     Load a TOML configuration file, returning the ``[pccc]`` section.
     If the file is ``pyproject.toml``, then the ``[tool.pccc]``
-    section is returned.
+    section is returned.  A file without the section is not a pccc
+    configuration and returns ``None``.
 
     Parameters
     ----------
@@ -484,13 +627,13 @@ def _load_toml_file(filename="pyproject.toml"):
 
     Returns
     -------
-    dict
+    dict or None
        Configuration option keys and values, with unset values
-       explicitly set to ``None``.
+       explicitly set to ``None``, or ``None`` without the section.
 
     Raises
     ------
-    TomlDecodeError
+    TOMLDecodeError
         Raised if there are problems decoding a TOML configuration
         file.
     FileNotFoundError
@@ -498,46 +641,24 @@ def _load_toml_file(filename="pyproject.toml"):
         readable.
     """
     try:
-        with open(filename, "r") as file:
-            config = toml.load(file)
-    except toml.TomlDecodeError as error:
-        lines = error.doc.split("\n")
-        print(
-            f"In configuration file {filename},"
-            f" line {error.lineno}, column {error.colno}:"
-        )
-        print(lines[error.lineno - 1])
-        print(error.msg)
+        config = _parse_file(filename, "toml")
+    except tomllib.TOMLDecodeError as error:
+        print(f"In configuration file {filename}:")
+        print(error)
         raise
     except FileNotFoundError as error:
         print(f"{error.strerror}: {error.filename}")
         raise
 
-    empty_options = {
-        "commit": None,
-        "config_file": None,
-        "header_length": None,
-        "body_length": None,
-        "spell_check": None,
-        "wrap": None,
-        "force_wrap": None,
-        "repair": None,
-        "types": None,
-        "scopes": None,
-        "footers": None,
-        "required_footers": None,
-        "ignore_generated_commits": None,
-        "generated_commits": None,
-    }
-
     if "pyproject.toml" in filename:
-        for k, v in config["tool"]["pccc"].items():
-            empty_options[k] = v
+        section = config.get("tool", {}).get("pccc")
     else:
-        for k, v in config["pccc"].items():
-            empty_options[k] = v
+        section = config.get("pccc")
 
-    return empty_options
+    if section is None:
+        return None
+
+    return {**_EMPTY_OPTIONS, **copy.deepcopy(section)}
 
 
 def _load_yaml_file(filename="./pccc.yaml"):
@@ -598,8 +719,13 @@ def _load_bespon_file(filename="./pccc.besp"):
     raise NotImplementedError
 
 
+@functools.lru_cache(maxsize=1)
 def _create_argument_parser():
-    """Create an argparse argument parser."""
+    """Create an argparse argument parser.
+
+    The parser holds no state between calls to ``parse_args()``, so
+    it is built once and cached for reuse by every ``Config.load()``.
+    """
     parser = argparse.ArgumentParser(
         description="""\
 This program comes with ABSOLUTELY NO WARRANTY; for details type
@@ -812,9 +938,7 @@ to redistribute it under certain conditions; type ``pccc
     return parser
 
 
-class _ShowLicenseAction(argparse.Action):
-    def __call__(self, parser, namespace, values, option_string=None):
-        license = """\
+_LICENSE = """\
 pccc:  The Python Conventional Commit Checker.
 
 Copyright (C) 2021-2023 Jeremy A Gray <jeremy.a.gray@gmail.com>.
@@ -833,14 +957,16 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 """
+
+
+class _ShowLicenseAction(argparse.Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        import textwrap
+
         print(
             "\n\n".join(
-                list(
-                    map(
-                        lambda item: "\n".join(textwrap.wrap(item.strip(), 72)),
-                        textwrap.dedent(license).strip().split("\n\n"),
-                    )
-                )
+                textwrap.fill(paragraph.strip(), 72)
+                for paragraph in textwrap.dedent(_LICENSE).strip().split("\n\n")
             )
         )
 
@@ -848,7 +974,4 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
 def _field_list_handler(s):
-    if len(s) == 0:
-        return []
-    else:
-        return [item.strip() for item in s.split(",")]
+    return [item for item in _FIELD_LIST_SEPARATOR.split(s.strip()) if item]
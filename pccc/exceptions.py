@@ -12,6 +12,9 @@
 
 from pyparsing import ParseFatalException
 
+# Characters of context shown on each side of an unparseable character.
+_CONTEXT_LENGTH = 40
+
 
 class ClosesIssueParseException(ParseFatalException):
     """Github closes issue string not parseable."""
@@ -25,19 +28,30 @@ class ClosesIssueParseException(ParseFatalException):
         self.elem = elem
 
     def __str__(self):
-        """Stringify a ``ClosesIssueParseException``."""
-        parseable = self.string[: self.loc]
-        bad_char = self.string[self.loc]
-        unparseable = self.string[self.loc + 1 :]
-        msg = (
+        """Stringify a ``ClosesIssueParseException``.
+
+        Only ``_CONTEXT_LENGTH`` characters on each side of the
+        unparseable character are shown; elided text is marked with
+        ``...``.
+        """
+        start = max(0, self.loc - _CONTEXT_LENGTH)
+        end = self.loc + 1 + _CONTEXT_LENGTH
+        parseable = self.string[start : self.loc]
+        bad_char = self.string[self.loc : self.loc + 1]
+        unparseable = self.string[self.loc + 1 : end]
+
+        if start > 0:
+            parseable = f"...{parseable}"
+        if end < len(self.string):
+            unparseable = f"{unparseable}..."
+
+        return (
             "One or more malformed Github issue references on or after"
             f" character position {self.loc + 1} in"
             f'"{parseable}[{bad_char}]{unparseable}".'
+            f"\nparseable: {parseable}"
+            f"\nunparseable: {bad_char}{unparseable}"
         )
-        msg += f"\nparseable: {parseable}"
-        msg += f"\nunparseable: {bad_char + unparseable}"
-
-        return msg
 
     def __repr__(self):
         """Reproduce a ``ClosesIssueParseException``."""
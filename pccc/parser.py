@@ -11,9 +11,11 @@
 """pccc parser functions and classes."""
 
 import fileinput
+import functools
 import re
 import sys
 import textwrap
+import threading
 
 import pyparsing as pp
 from enchant.checker import SpellChecker
@@ -26,6 +28,21 @@ from .exceptions import HeaderLengthError
 
 PYPARSING_DEBUG = False
 
+# Commit message comment and spell check ignore lines.
+_COMMENT = re.compile(r"^\s*#")
+_SPELL_IGNORE = re.compile(r"^\s*#\s*IGNORE:")
+_SPELL_IGNORE_WORD = re.compile(r"^\s*#\s*IGNORE:\s*(\w+)")
+
+# A commit that is only a header, without whitespace around its
+# fields, for ``ConventionalCommitRunner._parse_header_only()``.
+_HEADER_ONLY = re.compile(
+    r"(?P<type>[^\s():!]+)(?:\((?P<scope>[^\s()]+)\))?(?P<flag>!)?"
+    r": (?P<description>[^\s][^\t\n]*)\n"
+)
+
+# The commit being parsed by the current thread.
+_parsing = threading.local()
+
 
 class ConventionalCommit:
     """Class describing a conventional commit.
@@ -138,22 +155,10 @@ class ConventionalCommit:
 
     def _stringify_header(self):
         """Stringify a parsed commit header."""
-        if self.header["scope"] != "" and not self.breaking["flag"]:
-            header = (
-                rf"{self.header['type']}({self.header['scope']}):"
-                rf" {self.header['description']}"
-            )
-        elif self.header["scope"] != "" and self.breaking["flag"]:
-            header = (
-                rf"{self.header['type']}({self.header['scope']})!:"
-                rf" {self.header['description']}"
-            )
-        elif self.header["scope"] == "" and not self.breaking["flag"]:
-            header = rf"{self.header['type']}: {self.header['description']}"
-        elif self.header["scope"] == "" and self.breaking["flag"]:
-            header = rf"{self.header['type']}!: {self.header['description']}"
+        scope = f"({self.header['scope']})" if self.header["scope"] else ""
+        flag = "!" if self.breaking["flag"] else ""
 
-        return header
+        return f"{self.header['type']}{scope}{flag}: {self.header['description']}"
 
     def _stringify_body(self):
         """Stringify a parsed commit body."""
@@ -227,8 +232,7 @@ class ConventionalCommitRunner(ConventionalCommit):
 
     def _add_spell_ignore_word(self, line):
         """Add word to spelling ignore list."""
-        ignore = re.compile(r"^\s*#\s*IGNORE:\s*(\w+).*$")
-        match = ignore.match(line)
+        match = _SPELL_IGNORE_WORD.match(line)
 
         self.spell_ignore_words.append(match.group(1))
 
@@ -240,21 +244,19 @@ class ConventionalCommitRunner(ConventionalCommit):
         Remove all comment lines (matching the regular expression
         ``"^\\s*#.*$"``) from a commit message before parsing.
         """
-        comment = re.compile(r"^\s*#.*$")
-        ignore = re.compile(r"^\s*#\s*IGNORE:.*$")
-        cleaned = ""
+        cleaned = []
 
         for line in self.raw.rstrip().split("\n"):
             # Grab words to ignore on spell check.
-            if ignore.match(line):
+            if _SPELL_IGNORE.match(line):
                 self._add_spell_ignore_word(line)
                 continue
 
             # Remove comments.
-            if not comment.match(line):
-                cleaned += line + "\n"
+            if not _COMMENT.match(line):
+                cleaned.append(line + "\n")
 
-        self.cleaned = cleaned
+        self.cleaned = "".join(cleaned)
 
     def get(self):
         r"""Read a commit from a file or ``STDIN``.
@@ -262,13 +264,9 @@ class ConventionalCommitRunner(ConventionalCommit):
         Loads a the commit message from the file specified in the
         configuration, defaulting to ``STDIN``.
         """
-        commit = ""
         try:
             with fileinput.FileInput(files=(self.options.commit), mode="r") as input:
-                for line in input:
-                    commit += line
-
-            self.raw = commit
+                self.raw = "".join(input)
         except FileNotFoundError as error:
             print(f"{error.strerror}: {error.filename}")
             raise
@@ -516,7 +514,41 @@ class ConventionalCommitRunner(ConventionalCommit):
 
         return self
 
-    def parse(self):  # noqa: C901
+    def _parse_header_only(self):
+        """Parse a commit consisting of only a canonical header.
+
+        Most commits are a single header line without extra
+        whitespace, which can be parsed with one regular expression
+        instead of the full grammar.  Anything else, including types
+        or scopes that are not configured, is left for ``parse()``.
+
+        Returns
+        -------
+        boolean
+            ``True`` if the commit was parsed, ``False`` otherwise.
+        """
+        match = _HEADER_ONLY.fullmatch(self.cleaned)
+
+        if (
+            match is None
+            or match["type"] not in self.options.types
+            or (
+                match["scope"] is not None and match["scope"] not in self.options.scopes
+            )
+        ):
+            return False
+
+        self.header["type"] = match["type"]
+        if match["scope"] is not None:
+            self.header["scope"] = match["scope"]
+        self.header["description"] = match["description"].strip()
+        self.header["length"] = len(self.cleaned) - 1
+        if match["flag"]:
+            self.breaking["flag"] = True
+
+        return True
+
+    def parse(self):
         r"""Parse a conventional commit message.
 
         Parse a conventional commit message according to the
@@ -554,205 +586,22 @@ class ConventionalCommitRunner(ConventionalCommit):
                 ( ( close[ds] | fix(ed|es) | resolve[ds] )
                   owner/repo#number )
         """
-        pp.ParserElement.defaultWhitespaceChars = "\t"
-
-        types = self.options.types
-        scopes = self.options.scopes
-        breakers = ("BREAKING CHANGE", "BREAKING-CHANGE")
-        footers = list(self.options.footers) + list(breakers)
-
-        def _header_handler(s, loc, tokens):
-            """Find the length of the header."""
-            tokens[0].append(tokens[0].pop()[0])
-            self.header["length"] = len("".join(tokens[0]))
-
-        def _header_type_handler(s, loc, tokens):
-            """Get the header type field."""
-            self.header["type"] = tokens[0]
-
-        def _header_scope_handler(s, loc, tokens):
-            """Get the header scope field."""
-            self.header["scope"] = tokens[1]
-
-        def _header_desc_handler(s, loc, tokens):
-            """Get the header description."""
-            self.header["description"] = tokens[0][0].strip()
-
-        def _breaking_flag_handler(s, loc, tokens):
-            """Set the breaking flag state."""
-            if tokens[0] == "!":
-                self.breaking["flag"] = True
-
-        def _breaking_handler(s, loc, tokens):
-            """Get the breaking change field values."""
-            self.breaking["token"] = tokens[0][0]
-            self.breaking["separator"] = tokens[0][1]
-            self.breaking["value"] = "\n".join(tokens[0][2])
-
-        def _closes_handler(s, loc, tokens):
-            """Parse the Github issue closing footers."""
-            # token = "github-closes"
-            # sep = ": "
-            keyword = pp.oneOf(
-                (
-                    "close",
-                    "closed",
-                    "closes",
-                    "fix",
-                    "fixed",
-                    "fixes",
-                    "resolve",
-                    "resolved",
-                    "resolves",
-                ),
-            ).setResultsName("keyword", listAllMatches=True)
-
-            owner = pp.Regex(
-                r"[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}"
-            ).setResultsName("owner", listAllMatches=True)
-
-            repo = pp.Regex(
-                r"[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}"
-            ).setResultsName("repo", listAllMatches=True)
-
-            number = pp.Regex(r"[0-9]+").setResultsName(
-                "number",
-                listAllMatches=True,
-            )
-
-            issue = (
-                pp.Group(keyword + pp.Optional(owner + "/") + repo + "#" + number)
-                .setResultsName("issue", listAllMatches=True)
-                .setDebug(flag=PYPARSING_DEBUG)
-            )
-
-            issues = pp.Group(
-                issue + pp.ZeroOrMore(pp.Suppress(", ") + issue) + pp.StringEnd()
-            ).setDebug(flag=PYPARSING_DEBUG)
-
-            try:
-                matches = issues.parseString(tokens[0][2][0], parseAll=True)
-            except pp.ParseException as error:
-                raise ClosesIssueParseException(
-                    error.line,
-                    error.args[1],
-                    error.args[2],
-                    tokens[0][2][0],
-                )
-
-            for match in matches[0]:
-                data = {}
-                for k, v in match.items():
-                    data[k] = v[0]
-                self.closes_issues.append(data)
-
-        def _footer_handler(s, loc, tokens):
-            """Build the footer dicts from field values."""
-            for footer in tokens:
-                if footer[0].upper() in breakers:
-                    _breaking_handler(s, loc, tokens)
-                    continue
-                if footer[0].lower() == "github-closes":
-                    _closes_handler(s, loc, tokens)
-                self.footers.append(
-                    {
-                        "token": footer[0].lower().capitalize(),
-                        "separator": footer[1],
-                        "value": "\n".join(footer[2]),
-                    }
-                )
-
-        def _body_handler(s, loc, tokens):
-            """Process the body tokens.
-
-            Calculate the longest body line and store the body paragraphs.
-            """
-            nll = False
-            par = []
-
-            for line in tokens:
-                if nll and line == "\n":
-                    self.body["paragraphs"].append("".join(par))
-                    par = []
-                else:
-                    par.append(line)
-
-                if line == "\n":
-                    nll = True
-                else:
-                    nll = False
-
-                if self.body["longest"] < len(line):
-                    self.body["longest"] = len(line)
-
-            # Append the last paragraph, if present.
-            if par:
-                self.body["paragraphs"].append("".join(par))
+        if self._parse_header_only():
+            return
 
-        eos = pp.StringEnd()
-
-        type = (
-            pp.oneOf(types)
-            .setResultsName("type", listAllMatches=True)
-            .setParseAction(_header_type_handler)
-        )
-        scope = (
-            ("(" + pp.oneOf(scopes) + ")")
-            .setResultsName("scope", listAllMatches=True)
-            .setParseAction(_header_scope_handler)
-        )
-        header_breaking_flag = (
-            pp.Regex(r"!")
-            .setResultsName("header-breaking-flag", listAllMatches=True)
-            .setParseAction(_breaking_flag_handler)
-        )
-        header_sep = pp.Regex(r": ")
-        newline = pp.LineEnd().suppress()
-        header_desc = (
-            pp.Group(~newline + ~eos + pp.Regex(r".*"))
-            .setResultsName("header-desc", listAllMatches=True)
-            .setParseAction(_header_desc_handler)
-        )
-        header = (
-            pp.Group(
-                type
-                + pp.Optional(scope)
-                + pp.Optional(header_breaking_flag)
-                + header_sep
-                + header_desc
-            )
-            .setResultsName("header", listAllMatches=True)
-            .setParseAction(_header_handler)
-        )
-
-        footer_sep = pp.Regex(r"(: | #)").setWhitespaceChars("	\n")
-        footer_token = pp.oneOf(footers, caseless=True).setResultsName(
-            "footer-token", listAllMatches=True
+        grammar = _commit_grammar(
+            tuple(self.options.types),
+            tuple(self.options.scopes),
+            tuple(self.options.footers),
         )
-        footer_value = (
-            pp.Group(pp.OneOrMore(~eos + ~footer_token + pp.Regex(r".*")))
-            .setWhitespaceChars(" 	")
-            .setResultsName("footer-value", listAllMatches=True)
-        )
-        footer = (
-            pp.Group(footer_token + footer_sep + footer_value)
-            .setResultsName("footers", listAllMatches=True)
-            .setParseAction(_footer_handler)
-        )
-
-        line = pp.Regex(r".*")
-        bnewline = pp.LineEnd()
-        skip = bnewline + bnewline
-        par = pp.OneOrMore(~eos + ~footer + ~bnewline + line + bnewline)
-        body = skip + pp.OneOrMore(
-            ~eos + ~footer + par + pp.Optional(bnewline)
-        ).setParseAction(_body_handler)
-
-        commit_msg = (
-            header + pp.Optional(body) + pp.ZeroOrMore(footer)
-        ).setResultsName("commit-msg", listAllMatches=True)
 
-        commit_msg.parseString(self.cleaned)
+        # The cached grammar's parse actions store their results on
+        # the commit being parsed.
+        _parsing.commit = self
+        try:
+            grammar.parseString(self.cleaned)
+        finally:
+            del _parsing.commit
 
         return
 
@@ -779,6 +628,239 @@ class ConventionalCommitRunner(ConventionalCommit):
         return False
 
 
+@functools.lru_cache(maxsize=32)
+def _commit_grammar(types, scopes, footers):  # noqa: C901
+    """Build the conventional commit grammar.
+
+    Build the grammar described in ``ConventionalCommitRunner.parse()``
+    for the given types, scopes, and footers.  Grammars are cached by
+    these tuples, so each configuration builds its grammar once per
+    process.  The parse actions store their results on the commit in
+    ``_parsing.commit``, which ``parse()`` sets for each parse.
+
+    Parameters
+    ----------
+    types : tuple of string
+        Allowable header types.
+    scopes : tuple of string
+        Allowable header scopes.
+    footers : tuple of string
+        Allowable footer tokens, excluding the breaking change tokens.
+
+    Returns
+    -------
+    object
+        The ``commit-msg`` pyparsing element.
+    """
+    pp.ParserElement.defaultWhitespaceChars = "\t"
+
+    breakers = ("BREAKING CHANGE", "BREAKING-CHANGE")
+    footers = list(footers) + list(breakers)
+
+    # Github issue closing footer value, parsed by ``_closes_handler()``.
+    # token = "github-closes"
+    # sep = ": "
+    keyword = pp.oneOf(
+        (
+            "close",
+            "closed",
+            "closes",
+            "fix",
+            "fixed",
+            "fixes",
+            "resolve",
+            "resolved",
+            "resolves",
+        ),
+    ).setResultsName("keyword", listAllMatches=True)
+
+    owner = pp.Regex(
+        r"[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}"
+    ).setResultsName("owner", listAllMatches=True)
+
+    repo = pp.Regex(
+        r"[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}"
+    ).setResultsName("repo", listAllMatches=True)
+
+    number = pp.Regex(r"[0-9]+").setResultsName(
+        "number",
+        listAllMatches=True,
+    )
+
+    issue = (
+        pp.Group(keyword + pp.Optional(owner + "/") + repo + "#" + number)
+        .setResultsName("issue", listAllMatches=True)
+        .setDebug(flag=PYPARSING_DEBUG)
+    )
+
+    issues = pp.Group(
+        issue + pp.ZeroOrMore(pp.Suppress(", ") + issue) + pp.StringEnd()
+    ).setDebug(flag=PYPARSING_DEBUG)
+
+    def _header_handler(s, loc, tokens):
+        """Find the length of the header."""
+        commit = _parsing.commit
+        tokens[0].append(tokens[0].pop()[0])
+        commit.header["length"] = len("".join(tokens[0]))
+
+    def _header_type_handler(s, loc, tokens):
+        """Get the header type field."""
+        commit = _parsing.commit
+        commit.header["type"] = tokens[0]
+
+    def _header_scope_handler(s, loc, tokens):
+        """Get the header scope field."""
+        commit = _parsing.commit
+        commit.header["scope"] = tokens[1]
+
+    def _header_desc_handler(s, loc, tokens):
+        """Get the header description."""
+        commit = _parsing.commit
+        commit.header["description"] = tokens[0][0].strip()
+
+    def _breaking_flag_handler(s, loc, tokens):
+        """Set the breaking flag state."""
+        commit = _parsing.commit
+        if tokens[0] == "!":
+            commit.breaking["flag"] = True
+
+    def _breaking_handler(s, loc, tokens):
+        """Get the breaking change field values."""
+        commit = _parsing.commit
+        commit.breaking["token"] = tokens[0][0]
+        commit.breaking["separator"] = tokens[0][1]
+        commit.breaking["value"] = "\n".join(tokens[0][2])
+
+    def _closes_handler(s, loc, tokens):
+        """Parse the Github issue closing footers."""
+        commit = _parsing.commit
+        try:
+            matches = issues.parseString(tokens[0][2][0], parseAll=True)
+        except pp.ParseException as error:
+            raise ClosesIssueParseException(
+                error.line,
+                error.args[1],
+                error.args[2],
+                tokens[0][2][0],
+            )
+
+        for match in matches[0]:
+            data = {}
+            for k, v in match.items():
+                data[k] = v[0]
+            commit.closes_issues.append(data)
+
+    def _footer_handler(s, loc, tokens):
+        """Build the footer dicts from field values."""
+        commit = _parsing.commit
+        for footer in tokens:
+            if footer[0].upper() in breakers:
+                _breaking_handler(s, loc, tokens)
+                continue
+            if footer[0].lower() == "github-closes":
+                _closes_handler(s, loc, tokens)
+            commit.footers.append(
+                {
+                    "token": footer[0].lower().capitalize(),
+                    "separator": footer[1],
+                    "value": "\n".join(footer[2]),
+                }
+            )
+
+    def _body_handler(s, loc, tokens):
+        """Process the body tokens.
+
+        Calculate the longest body line and store the body paragraphs.
+        """
+        commit = _parsing.commit
+        nll = False
+        par = []
+
+        for line in tokens:
+            if nll and line == "\n":
+                commit.body["paragraphs"].append("".join(par))
+                par = []
+            else:
+                par.append(line)
+
+            if line == "\n":
+                nll = True
+            else:
+                nll = False
+
+            if commit.body["longest"] < len(line):
+                commit.body["longest"] = len(line)
+
+        # Append the last paragraph, if present.
+        if par:
+            commit.body["paragraphs"].append("".join(par))
+
+    eos = pp.StringEnd()
+
+    type = (
+        pp.oneOf(types)
+        .setResultsName("type", listAllMatches=True)
+        .setParseAction(_header_type_handler)
+    )
+    scope = (
+        ("(" + pp.oneOf(scopes) + ")")
+        .setResultsName("scope", listAllMatches=True)
+        .setParseAction(_header_scope_handler)
+    )
+    header_breaking_flag = (
+        pp.Regex(r"!")
+        .setResultsName("header-breaking-flag", listAllMatches=True)
+        .setParseAction(_breaking_flag_handler)
+    )
+    header_sep = pp.Regex(r": ")
+    newline = pp.LineEnd().suppress()
+    header_desc = (
+        pp.Group(~newline + ~eos + pp.Regex(r".*"))
+        .setResultsName("header-desc", listAllMatches=True)
+        .setParseAction(_header_desc_handler)
+    )
+    header = (
+        pp.Group(
+            type
+            + pp.Optional(scope)
+            + pp.Optional(header_breaking_flag)
+            + header_sep
+            + header_desc
+        )
+        .setResultsName("header", listAllMatches=True)
+        .setParseAction(_header_handler)
+    )
+
+    footer_sep = pp.Regex(r"(: | #)").setWhitespaceChars("	\n")
+    footer_token = pp.oneOf(footers, caseless=True).setResultsName(
+        "footer-token", listAllMatches=True
+    )
+    footer_value = (
+        pp.Group(pp.OneOrMore(~eos + ~footer_token + pp.Regex(r".*")))
+        .setWhitespaceChars(" 	")
+        .setResultsName("footer-value", listAllMatches=True)
+    )
+    footer = (
+        pp.Group(footer_token + footer_sep + footer_value)
+        .setResultsName("footers", listAllMatches=True)
+        .setParseAction(_footer_handler)
+    )
+
+    line = pp.Regex(r".*")
+    bnewline = pp.LineEnd()
+    skip = bnewline + bnewline
+    par = pp.OneOrMore(~eos + ~footer + ~bnewline + line + bnewline)
+    body = skip + pp.OneOrMore(
+        ~eos + ~footer + par + pp.Optional(bnewline)
+    ).setParseAction(_body_handler)
+
+    commit_msg = (header + pp.Optional(body) + pp.ZeroOrMore(footer)).setResultsName(
+        "commit-msg", listAllMatches=True
+    )
+
+    return commit_msg
+
+
 def main(argv=None):
     """Run the default program.
 
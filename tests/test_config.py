@@ -22,6 +22,11 @@ from hypothesis import given
 from hypothesis import strategies as st
 from ruamel.yaml import YAML
 
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
 sys.path.insert(0, "/home/gray/src/work/pccc")
 
 import pccc  # noqa: E402
@@ -176,6 +181,29 @@ def test_reproduce_config(conf):
     assert f"scopes={conf.scopes}" in repr(ccr.options)
 
 
+def test_config_list_defaults_not_shared():
+    """Should not share default lists between ``Config()`` objects."""
+    one = pccc.Config()
+    one.types.append("docs")
+    one.scopes.append("parser")
+
+    two = pccc.Config()
+
+    assert two.types == ["feat", "fix"]
+    assert two.scopes == []
+
+
+def test_config_update():
+    """Should update only configuration options with set values."""
+    conf = pccc.Config()
+    conf.update(body_length=80, header_length=None, load="clobbered", bogus=True)
+
+    assert conf.body_length == 80
+    assert conf.header_length == 50
+    assert callable(conf.load)
+    assert not hasattr(conf, "bogus")
+
+
 # FIXME
 @pytest.mark.parametrize(
     "fn, data",
@@ -437,6 +465,34 @@ def test_config_file_loading_order(fs):
         fs.remove_object(file)
 
 
+def test_config_file_loading_order_no_section(fs):
+    """Should skip configuration files without a pccc section."""
+    fs.create_file("pyproject.toml")
+    with open("pyproject.toml", "w") as file:
+        file.write("[tool.black]\n\nline-length = 88\n")
+
+    fs.create_file("pccc.toml")
+    with open("pccc.toml", "w") as file:
+        file.write("[pccc]\n\nbody_length = 66\n")
+
+    fs.create_file("package.json")
+    with open("package.json", "w") as file:
+        file.write('{"name": "pccc"}\n')
+
+    fs.create_file("pccc.json")
+    with open("pccc.json", "w") as file:
+        file.write('{"pccc": {"body_length": 67}}\n')
+
+    ccr = pccc.ConventionalCommitRunner()
+    ccr.options.load([])
+    assert ccr.options.body_length == 66
+
+    fs.remove_object("pccc.toml")
+    ccr = pccc.ConventionalCommitRunner()
+    ccr.options.load([])
+    assert ccr.options.body_length == 67
+
+
 def test_no_config_files(fs):
     """Should use defaults if no configuration files."""
     ccr = pccc.ConventionalCommitRunner()
@@ -478,6 +534,67 @@ def test_nonexistent_config_files():
         assert ccr.options.body_length == 72
 
 
+def test_nonexistent_config_file_reported(capsys, fs):
+    """Should report a missing configuration file named by the user."""
+    fs.create_file("pyproject.toml")
+    with open("pyproject.toml", "w") as file:
+        file.write("[tool.pccc]\n\nbody_length = 66\n")
+
+    ccr = pccc.ConventionalCommitRunner()
+    ccr.options.load(["--config", "typo.toml"])
+    out = capsys.readouterr().out
+
+    assert ccr.options.body_length == 66
+    assert "No such file or directory: typo.toml" in out
+    assert "pccc.toml" not in out
+
+
+def test_default_config_file_tried_once(capsys, monkeypatch, fs):
+    """Should try a user-named default configuration file only once."""
+    tried = []
+    determine = pccc.config._determine_file_format
+
+    def _determine_file_format(filename):
+        tried.append(filename)
+        return determine(filename)
+
+    monkeypatch.setattr(
+        pccc.config,
+        "_determine_file_format",
+        _determine_file_format,
+    )
+
+    fs.create_file("pyproject.toml")
+    with open("pyproject.toml", "w") as file:
+        file.write("[tool.black]\n\nline-length = 88\n")
+
+    ccr = pccc.ConventionalCommitRunner()
+    ccr.options.load(["--config", "pyproject.toml"])
+
+    assert ccr.options.body_length == 72
+    assert tried == ["pyproject.toml"]
+
+    fs.remove_object("pyproject.toml")
+    ccr = pccc.ConventionalCommitRunner()
+    ccr.options.load(["--config", "pyproject.toml"])
+
+    assert capsys.readouterr().out == ""
+
+
+def test_config_file_no_section_reported(capsys, fs):
+    """Should report a user-named configuration file without a section."""
+    fs.create_file("my.toml")
+    with open("my.toml", "w") as file:
+        file.write("[pcc]\n\nbody_length = 66\n")
+
+    ccr = pccc.ConventionalCommitRunner()
+    ccr.options.load(["--config", "my.toml"])
+    out = capsys.readouterr().out
+
+    assert ccr.options.body_length == 72
+    assert "my.toml: no pccc configuration section" in out
+
+
 def test__determine_file_format_toml(fs):
     """Should identify a TOML file."""
     filename = "config.toml"
@@ -548,6 +665,52 @@ def test__determine_file_format_bespon(fs):
         pccc._determine_file_format(filename)
 
 
+def test__determine_file_format_parse_reused(fs):
+    """Should not parse the file again when loading it."""
+    filename = "custom.toml"
+    fs.create_file(filename)
+    with open(filename, "w") as file:
+        file.write("[pccc]\n\nbody_length = 68\n")
+
+    pccc.config._parse_file_cached.cache_clear()
+    options = pccc.config._load_file(filename)
+    info = pccc.config._parse_file_cached.cache_info()
+
+    assert options["body_length"] == 68
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test__determine_file_format_read_once(fs):
+    """Should read a file once while trying each format."""
+    filename = "custom.json"
+    fs.create_file(filename)
+    with open(filename, "w") as file:
+        file.write('{"pccc": {"body_length": 68}}\n')
+
+    pccc.config._slurp.cache_clear()
+    options = pccc.config._load_file(filename)
+    info = pccc.config._slurp.cache_info()
+
+    assert options["body_length"] == 68
+    assert info.misses == 1
+
+
+def test__determine_file_format_sniffed(fs):
+    """Should parse a JSON file once, whatever its extension."""
+    filename = "config.toml"
+    fs.create_file(filename)
+    with open(filename, "w") as file:
+        file.write('  {"pccc": {"body_length": 68}}\n')
+
+    pccc.config._parse_file_cached.cache_clear()
+    format = pccc._determine_file_format(filename)
+    info = pccc.config._parse_file_cached.cache_info()
+
+    assert format == "json"
+    assert info.misses == 1
+
+
 def test__determine_file_format_no_file(fs):
     """Should raise ``FileNotFoundError``."""
     filename = "not.here"
@@ -575,8 +738,36 @@ def test__load_toml_file(fs):
     assert options["body_length"] == 68
 
 
+def test__load_toml_file_no_section(fs):
+    """Should return ``None`` without a ``[tool.pccc]`` section."""
+    filename = "pyproject.toml"
+    fs.create_file(filename)
+    with open(filename, "w") as file:
+        file.write("[tool.black]\n\nline-length = 88\n")
+
+    assert pccc._load_toml_file(filename) is None
+
+
+def test__load_toml_file_cached(fs):
+    """Should reuse unchanged parses and reparse edited files."""
+    filename = "config.toml"
+    fs.create_file(filename)
+    with open(filename, "w") as file:
+        file.write('[pccc]\n\nbody_length = 68\ntypes = ["feat", "fix"]\n')
+
+    options = pccc._load_toml_file(filename)
+    options["types"].append("docs")
+
+    assert pccc._load_toml_file(filename)["types"] == ["feat", "fix"]
+
+    with open(filename, "w") as file:
+        file.write("[pccc]\n\nbody_length = 100\n")
+
+    assert pccc._load_toml_file(filename)["body_length"] == 100
+
+
 def test__load_toml_file_bad_format(fs):
-    """Should raise ``TomlDecodeError``."""
+    """Should raise ``TOMLDecodeError``."""
     filename = "config.toml"
     fs.create_file(filename)
     with open(filename, "w") as file:
@@ -588,7 +779,7 @@ def test__load_toml_file_bad_format(fs):
         }
         json.dump(data, file)
 
-    with pytest.raises(toml.TomlDecodeError):
+    with pytest.raises(tomllib.TOMLDecodeError):
         pccc._load_toml_file(filename)
 
 
@@ -636,6 +827,19 @@ def test__load_json_file_bad_format(fs):
         pccc._load_json_file(filename)
 
 
+def test__load_json_file_bad_format_line(capsys, fs):
+    """Should print the line containing a ``JSONDecodeError``."""
+    filename = "config.json"
+    fs.create_file(filename)
+    with open(filename, "w") as file:
+        file.write('{"pccc": {\n  "body_length": 68,,\n}}\n')
+
+    with pytest.raises(json.JSONDecodeError):
+        pccc._load_json_file(filename)
+
+    assert 'line 2, column 21:\n  "body_length": 68,,\n' in capsys.readouterr().out
+
+
 def test__load_json_file_no_file(fs):
     """Should raise ``FileNotFoundError``."""
     filename = "not.here"
@@ -696,3 +900,23 @@ with this program.  If not, see <https://www.gnu.org/licenses/>.
         actual = capsys.readouterr().out
 
         assert actual == expected
+
+
+def test__create_argument_parser_cached():
+    """Should build the argument parser once and reuse it."""
+    parser = pccc.config._create_argument_parser()
+
+    assert pccc.config._create_argument_parser() is parser
+    assert parser.parse_args(["-l", "60"]).header_length == 60
+    assert parser.parse_args([]).header_length is None
+
+
+def test__field_list_handler():
+    """Should split a comma delimited list, dropping empty items."""
+    assert pccc.config._field_list_handler(" feat, fix,,docs ,") == [
+        "feat",
+        "fix",
+        "docs",
+    ]
+    assert pccc.config._field_list_handler("") == []
+    assert pccc.config._field_list_handler("  ") == []
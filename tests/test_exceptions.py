@@ -46,6 +46,25 @@ def test_stringify_closes_issue_parse_exception():
     )
 
 
+def test_stringify_closes_issue_parse_exception_long():
+    """Should show only the context around the unparseable character."""
+    begin = "b" * 100
+    bad = "x"
+    end = "e" * 100
+    string = begin + bad + end
+    location = len(begin)
+
+    error = pccc.ClosesIssueParseException(string, location, "error", None)
+
+    assert str(error) == (
+        "One or more malformed Github issue references on or after"
+        f" character position {location + 1} in"
+        f'"...{"b" * 40}[{bad}]{"e" * 40}...".'
+        f"\nparseable: ...{'b' * 40}"
+        f"\nunparseable: {bad + 'e' * 40}..."
+    )
+
+
 def test_reproduce_closes_issue_parse_exception():
     """Should reproduce a ``pccc.ClosesIssueParseException()``."""
     begin = "begin"
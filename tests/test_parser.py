@@ -360,3 +360,63 @@ def test_load_nonexistent_commit_file():
 
     with pytest.raises(FileNotFoundError):
         ccr.get()
+
+
+def test_parse_grammar_cached():
+    """Should reuse one grammar for commits with the same options."""
+    first = pccc.ConventionalCommitRunner()
+    pccc.parser._commit_grammar.cache_clear()
+    first.options.load("")
+    first.raw = "feat: add a feature\n\nWith a body.\n"
+    first.clean()
+    first.parse()
+
+    second = pccc.ConventionalCommitRunner()
+    second.options.load("")
+    second.raw = "fix!: fix a bug\n\nWith a body.\n"
+    second.clean()
+    second.parse()
+
+    info = pccc.parser._commit_grammar.cache_info()
+
+    assert info.misses == 1
+    assert info.hits == 1
+    assert first.header["type"] == "feat"
+    assert first.breaking["flag"] is False
+    assert second.header["type"] == "fix"
+    assert second.breaking["flag"] is True
+
+
+def test_parse_header_only():
+    """Should parse a header-only commit without the grammar."""
+    ccr = pccc.ConventionalCommitRunner()
+    pccc.parser._commit_grammar.cache_clear()
+    ccr.options.load("")
+    ccr.options.scopes = ["parser"]
+    ccr.raw = "fix(parser)!: fix a bug\n"
+    ccr.clean()
+    ccr.parse()
+
+    assert pccc.parser._commit_grammar.cache_info().misses == 0
+    assert ccr.header == {
+        "type": "fix",
+        "scope": "parser",
+        "description": "fix a bug",
+        "length": 23,
+    }
+    assert ccr.breaking["flag"] is True
+    assert ccr.body["paragraphs"] == []
+    assert ccr.footers == []
+    assert str(ccr) == "fix(parser)!: fix a bug\n"
+
+
+def test_parse_header_only_unknown_scope():
+    """Should leave unconfigured scopes to the grammar."""
+    ccr = pccc.ConventionalCommitRunner()
+    ccr.options.load("")
+    ccr.options.scopes = ["parser"]
+    ccr.raw = "fix(config): fix a bug\n"
+    ccr.clean()
+
+    with pytest.raises(pp.ParseBaseException):
+        ccr.parse()